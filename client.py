@@ -0,0 +1,41 @@
+# client.py - shared HTTP client for the ML service test scripts
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# orjson works on bytes in both directions; fall back to the stdlib codec
+try:
+    import orjson
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj).encode()
+    loads = json.loads
+
+ML_SERVICE_URL = "http://localhost:8001/api/analyze"
+
+# One keep-alive session reused by every script and every call
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+session.headers.update({"Content-Type": "application/json"})
+
+
+def post_json(url, payload):
+    """POST payload as a JSON body encoded by dumps"""
+    return session.post(url, data=dumps(payload))
+
+
+def post_all(requests_to_send):
+    """POST each (url, payload) pair concurrently; returns responses or exceptions in input order"""
+    def send(item):
+        url, payload = item
+        try:
+            return post_json(url, payload)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, len(requests_to_send))) as executor:
+        return list(executor.map(send, requests_to_send))
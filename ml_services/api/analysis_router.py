@@ -1,11 +1,17 @@
 # ml_services/api/analysis_router.py - Enhanced with Phase 2 Integration
 import ast
+from typing import List
 
 from fastapi import APIRouter, status, HTTPException
-from schemas.analysis_schemas import CodeAnalysisRequest, CodeAnalysisResponse
+from schemas.analysis_schemas import (
+    CodeAnalysisRequest, CodeAnalysisResponse, BatchAnalysisItem, BatchAnalysisResult
+)
 from config.log_config import get_logger
 from core.input_processor import InputProcessor
 from core.code_analyzer import CodeAnalyzer
+from models.internal_models import (
+    ALGO_PATTERN_STR, DATA_STRUCTURE_STR, LANGUAGE_STR, PROBLEM_TYPE_STR
+)
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/analysis", tags=["Code Analysis"])
@@ -13,6 +19,9 @@ router = APIRouter(prefix="/analysis", tags=["Code Analysis"])
 input_processor = InputProcessor()
 code_analyzer = CodeAnalyzer()
 
+# Items are analyzed one after another, so bound the work a single request can queue
+MAX_BATCH_ITEMS = 32
+
 @router.post("/", response_model=CodeAnalysisResponse, status_code=status.HTTP_202_ACCEPTED)
 async def analyze_code(request: CodeAnalysisRequest):
     """
@@ -55,14 +64,14 @@ async def analyze_code(request: CodeAnalysisRequest):
 
             # Phase 1 Results
             "problem_analysis": {
-                "problem_type": processed_data.problem_data.problem_type.value if processed_data.problem_data.problem_type else None,
+                "problem_type": PROBLEM_TYPE_STR.get(processed_data.problem_data.problem_type),
                 "title": processed_data.problem_data.title,
                 "constraints_count": len(processed_data.problem_data.constraints),
                 "test_cases_count": len(processed_data.problem_data.test_cases)
             },
 
             "code_metadata": {
-                "detected_language": processed_data.code_metadata.language.value,
+                "detected_language": LANGUAGE_STR[processed_data.code_metadata.language],
                 "function_name": processed_data.code_metadata.function_name,
                 "parameters": processed_data.code_metadata.parameters,
                 "lines_of_code": len(processed_data.cleaned_code.split('\n'))
@@ -74,10 +83,10 @@ async def analyze_code(request: CodeAnalysisRequest):
 
         if algorithm_analysis:
             response_data["algorithm_analysis"] = {
-                "primary_pattern": algorithm_analysis.primary_pattern.value if algorithm_analysis.primary_pattern else None,
+                "primary_pattern": ALGO_PATTERN_STR.get(algorithm_analysis.primary_pattern),
                 "confidence_score": round(algorithm_analysis.confidence_score, 3),
                 "problem_alignment": round(algorithm_analysis.problem_alignment, 3),
-                "data_structures_used": [ds.value for ds in algorithm_analysis.data_structures_used],
+                "data_structures_used": [DATA_STRUCTURE_STR[ds] for ds in algorithm_analysis.data_structures_used],
                 "time_complexity": algorithm_analysis.time_complexity,
                 "space_complexity": algorithm_analysis.space_complexity,
                 "optimization_techniques": algorithm_analysis.optimization_techniques,
@@ -106,14 +115,34 @@ async def analyze_code(request: CodeAnalysisRequest):
             }
         )
 
+@router.post("/batch", response_model=List[BatchAnalysisResult], status_code=status.HTTP_200_OK)
+async def analyze_batch(items: List[BatchAnalysisItem]):
+    """Analyze several submissions in one request; each item carries its own status"""
+    logger.info(f"Batch analysis request received with {len(items)} items")
+    if len(items) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error": "Batch too large",
+                "max_items": MAX_BATCH_ITEMS,
+                "received": len(items)
+            }
+        )
+    results = []
+    for item in items:
+        try:
+            body = await analyze_code(item)
+            results.append({"name": item.name, "status_code": status.HTTP_202_ACCEPTED, "result": body})
+        except HTTPException as e:
+            results.append({"name": item.name, "status_code": e.status_code, "error": e.detail})
+    return results
+
 @router.get("/patterns", status_code=status.HTTP_200_OK)
 async def get_supported_patterns():
     """Get list of supported algorithm patterns"""
-    from models.internal_models import AlgorithmPattern, ProblemType
-
     return {
-        "algorithm_patterns": [pattern.value for pattern in AlgorithmPattern],
-        "problem_types": [ptype.value for ptype in ProblemType],
+        "algorithm_patterns": list(ALGO_PATTERN_STR.values()),
+        "problem_types": list(PROBLEM_TYPE_STR.values()),
         "phase2_capabilities": [
             "AST-based code structure analysis",
             "Algorithm pattern recognition",
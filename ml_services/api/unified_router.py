@@ -1,12 +1,12 @@
 # Unified API router that matches frontend expectations
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from config.log_config import get_logger
 from core.input_processor import InputProcessor
 from core.code_analyzer import CodeAnalyzer
 from core.execution_simulator import ExecutionSimulator
-from models.internal_models import AlgorithmPattern
+from models.internal_models import AlgorithmPattern, ALGO_PATTERN_STR
 import ast
 
 logger = get_logger(__name__)
@@ -88,7 +88,8 @@ async def analyze_code_unified(request: AnalyzeRequest):
         execution_steps = execution_results.get('execution_steps', [])
         
         for i, step in enumerate(execution_steps):
-            viz_step = VisualizationStep(
+            # Steps are built from simulator output, so skip per-step validation
+            viz_step = VisualizationStep.model_construct(
                 type=_get_frontend_step_type(algorithm_analysis.primary_pattern),
                 description=f"Step {i+1}: {step.get('explanation', 'Processing...')}",
                 explanation=step.get('explanation', ''),
@@ -112,7 +113,7 @@ async def analyze_code_unified(request: AnalyzeRequest):
             confidence=algorithm_analysis.confidence_score,
             steps=frontend_steps,
             metadata={
-                "pattern": algorithm_analysis.primary_pattern.value,
+                "pattern": ALGO_PATTERN_STR[algorithm_analysis.primary_pattern],
                 "time_complexity": algorithm_analysis.time_complexity,
                 "space_complexity": algorithm_analysis.space_complexity,
                 "total_steps": len(frontend_steps)
@@ -120,7 +121,9 @@ async def analyze_code_unified(request: AnalyzeRequest):
         )
 
         logger.info(f"Analysis complete: {algorithm_name} with {len(frontend_steps)} steps")
-        return response
+        # Serialize once in pydantic-core; returning the model would have FastAPI
+        # dump, re-validate and re-encode it against response_model
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
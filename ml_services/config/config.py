@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Set, List
 
 class Settings(BaseSettings):
@@ -16,8 +16,7 @@ class Settings(BaseSettings):
     # Logging Level
     LOG_LEVEL: str = "INFO"
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
 # Create a single, importable instance of the settings
 settings = Settings()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 class Settings(BaseSettings):
@@ -8,8 +8,7 @@ class Settings(BaseSettings):
     environment: str
     port: Optional[int] = 8001  # Add this line - optional with default value
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env")
 
 def get_settings() -> Settings:
     return Settings()
@@ -1,10 +1,12 @@
+import ast
+import hashlib
 import numpy as np
 import joblib
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.feature_extraction import DictVectorizer
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Sequence, Tuple, Any, Union
 import os
 
 from models.internal_models import AlgorithmPattern
@@ -13,6 +15,9 @@ from config.log_config import get_logger
 
 logger = get_logger(__name__)
 
+# Predictions kept per matcher, keyed by a digest of the source text
+_PREDICTION_CACHE_SIZE = 4096
+
 class AIPatternMatcher:
     """ML-based algorithm pattern recognition"""
 
@@ -27,6 +32,7 @@ class AIPatternMatcher:
             class_weight='balanced'
         )
         self.is_trained = False
+        self._prediction_cache: Dict[bytes, Tuple[AlgorithmPattern, float]] = {}
 
         # Ensure model directory exists
         os.makedirs(model_path, exist_ok=True)
@@ -34,11 +40,12 @@ class AIPatternMatcher:
         # Try to load pre-trained model
         self._try_load_model()
 
-    def train(self, training_data: List[Tuple[str, str, AlgorithmPattern]]) -> Dict[str, float]:
+    def train(self, training_data: Sequence[Tuple[Union[ast.AST, str], str, AlgorithmPattern]]) -> Dict[str, float]:
         """Train the ML model on code samples
 
         Args:
-            training_data: List of (code_ast_str, code_text, pattern_label) tuples
+            training_data: (code_ast, code_text, pattern_label) tuples; code_ast is normally
+                the tree already parsed by TrainingDataBuilder, source strings are parsed here
         """
         logger.info(f"Training AI pattern matcher on {len(training_data)} samples")
 
@@ -49,7 +56,6 @@ class AIPatternMatcher:
         for ast_code, code_text, pattern in training_data:
             try:
                 # Parse AST from string if needed
-                import ast
                 if isinstance(ast_code, str):
                     tree = ast.parse(ast_code)
                 else:
@@ -89,6 +95,7 @@ class AIPatternMatcher:
         # Save model
         self._save_model()
         self.is_trained = True
+        self._prediction_cache.clear()
 
         return {
             'accuracy': accuracy,
@@ -101,6 +108,31 @@ class AIPatternMatcher:
         if not self.is_trained:
             raise ValueError("Model not trained. Call train() first or load pre-trained model.")
 
+        key = self._prediction_key(code_text)
+        if key is not None:
+            cached = self._prediction_cache.get(key)
+            if cached is not None:
+                return cached
+
+        pattern, confidence = self._predict_uncached(code_ast, code_text)
+
+        if key is not None and pattern is not None:
+            if len(self._prediction_cache) >= _PREDICTION_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._prediction_cache[next(iter(self._prediction_cache))]
+            self._prediction_cache[key] = (pattern, confidence)
+
+        return pattern, confidence
+
+    def _prediction_key(self, code_text: str):
+        """Digest of the source text, or None when there is no text to key on"""
+        if not code_text:
+            return None
+        # The tree and the text features are both derived from the source
+        return hashlib.blake2b(code_text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def _predict_uncached(self, code_ast, code_text: str) -> Tuple[AlgorithmPattern, float]:
+        """Run feature extraction and the classifier for one snippet"""
         try:
             # Extract features
             features = self.feature_extractor.extract_features(code_ast, code_text)
@@ -157,6 +189,7 @@ class AIPatternMatcher:
                 self.classifier = joblib.load(classifier_path)
                 self.vectorizer = joblib.load(vectorizer_path)
                 self.is_trained = True
+                self._prediction_cache.clear()
                 logger.info("Pre-trained model loaded successfully")
             else:
                 logger.info("No pre-trained model found")
@@ -1,6 +1,5 @@
 # core/input_processor.py
 import re
-import ast
 from typing import List, Dict, Any, Optional
 from models.internal_models import (
     ProcessedInput, ProblemData, CodeMetadata, TestCase,
@@ -34,20 +33,12 @@ class InputProcessor:
         # sanitize + security + syntax
         cleaned_code = self._sanitize_code(code)
 
-        security_warnings = self.code_validator.check_security(cleaned_code, language)
-        if security_warnings:
-            validation_errors.extend(security_warnings)
-
-        is_valid_syntax, syntax_errors = self.code_validator.validate_python_syntax(cleaned_code)
-        if not is_valid_syntax:
-            validation_errors.extend(syntax_errors)
-
-        # Build AST (best-effort)
-        code_ast = None
-        try:
-            code_ast = ast.parse(cleaned_code)
-        except SyntaxError:
-            pass
+        # One parse and one tree walk cover syntax, security and the AST (None if it does not parse)
+        validation = self.code_validator.analyze(cleaned_code, language)
+        validation_errors.extend(validation.warnings)
+        if not validation.is_valid:
+            validation_errors.extend(validation.errors)
+        code_ast = validation.tree
 
         #  problem parsing and assembly
         parsed_problem = self.problem_parser.parse(problem_statement)
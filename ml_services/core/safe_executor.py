@@ -5,13 +5,26 @@ import types
 import threading
 import time
 import platform
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from contextlib import contextmanager
 from core.execution_tracker import ExecutionTracker, ExecutionStep
+from utils.ast_cache import MAX_CACHED_SOURCE_LEN, parse_cached
 from config.log_config import get_logger
 
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=128)
+def _compile_cached(code: str) -> types.CodeType:
+    return compile(parse_cached(code), '<algorithm>', 'exec')
+
+def compile_source(code: str) -> Tuple[ast.AST, types.CodeType]:
+    """Parse and compile submitted code once per distinct source (trees are shared, read-only)"""
+    parsed = parse_cached(code)
+    if len(code) > MAX_CACHED_SOURCE_LEN:
+        return parsed, compile(parsed, '<algorithm>', 'exec')
+    return parsed, _compile_cached(code)
+
 class TimeoutException(Exception):
     """Raised when code execution exceeds time limit"""
     pass
@@ -38,7 +51,8 @@ class SafeExecutor:
 
         # Parse and validate the code
         try:
-            parsed = ast.parse(code)
+            # Cached per source, but validated on every call
+            parsed, code_obj = compile_source(code)
             self._validate_ast(parsed)
         except SyntaxError as e:
             raise ValueError(f"Syntax error in code: {e}")
@@ -62,7 +76,7 @@ class SafeExecutor:
                 sys.settrace(tracker.trace_execution)
 
                 # Execute the code
-                exec(compile(parsed, '<algorithm>', 'exec'), execution_globals, execution_locals)
+                exec(code_obj, execution_globals, execution_locals)
 
                 return tracker.steps
 
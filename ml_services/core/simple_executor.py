@@ -2,6 +2,7 @@
 import ast
 from typing import Dict, Any, List
 from core.execution_tracker import ExecutionStep
+from core.safe_executor import compile_source
 from config.log_config import get_logger
 
 logger = get_logger(__name__)
@@ -25,13 +26,13 @@ class SimpleExecutor:
         
         try:
             # Parse code to extract basic structure
-            parsed = ast.parse(code)
+            parsed, code_obj = compile_source(code)
             
             # Execute code safely
             execution_globals = {'__builtins__': self.safe_builtins}
             execution_locals = inputs.copy()
             
-            exec(compile(parsed, '<algorithm>', 'exec'), execution_globals, execution_locals)
+            exec(code_obj, execution_globals, execution_locals)
             
             # Generate basic steps from AST
             steps = self._generate_steps_from_ast(parsed, function_name, inputs)
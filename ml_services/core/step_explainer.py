@@ -1,9 +1,13 @@
 # ml_services/core/step_explainer.py
-import hashlib
-import re
-from typing import List, Dict, Any, Optional
+import atexit
+import os
+import sys
+import weakref
+from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
 from core.execution_tracker import ExecutionStep
+from core.step_explainer_hot import format_variable_changes, trim_explanation
+from core.viz_emitters import VizCache, emit_data_structure
 from models.internal_models import AlgorithmPattern
 from config.log_config import get_logger
 
@@ -17,6 +21,22 @@ except ImportError:
     OLLAMA_AVAILABLE = False
     logger.warning("Ollama not available, using fallback explanations")
 
+# Live Ollama clients; weak so the exit hook does not keep explainers alive
+_OPEN_CLIENTS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_clients():
+    """Close pooled Ollama HTTP clients still open on interpreter shutdown"""
+    for client in list(_OPEN_CLIENTS):
+        close = getattr(client, 'close', None)  # Older ollama clients have no close()
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+
 @dataclass
 class PromptTemplate:
     """Template for generating LLM prompts"""
@@ -33,11 +53,22 @@ class PromptTemplate:
 class StepExplainer:
     """AI-Enhanced step explainer using local LLM (Ollama)"""
 
+    # Keep the model resident between calls so consecutive prompts, which share
+    # the same per-pattern system prefix, can reuse Ollama's cached prefix K/V
+    KEEP_ALIVE = "10m"
+
     def __init__(self, model_name: str = "codellama:7b-instruct"):
         self.model_name = model_name
         self.explanation_cache = {}
         self.algorithm_prompts = self._initialize_algorithm_prompts()
         self.fallback_explainer = FallbackStepExplainer()
+        self._viz_cache: VizCache = {}
+
+        # Reuse one HTTP client (and its connection pool) for every Ollama call
+        self._client = None
+        if OLLAMA_AVAILABLE:
+            self._client = ollama.Client(host=os.getenv('OLLAMA_HOST', 'http://localhost:11434'))
+            _OPEN_CLIENTS.add(self._client)
 
     def _initialize_algorithm_prompts(self) -> Dict[AlgorithmPattern, PromptTemplate]:
         """Initialize algorithm-specific prompt templates"""
@@ -69,13 +100,18 @@ class StepExplainer:
             problem_context: Dict[str, Any]
     ) -> List[ExecutionStep]:
         """Add AI-enhanced educational explanations to execution steps"""
-        enhanced_steps = []
+        enhanced_steps = [None] * len(steps)
+        self._viz_cache = {}
+
+        for idx, step in enumerate(steps):
+            # Loop bodies repeat the same lines; interning makes cache-key
+            # hashing and comparisons on them pointer-cheap
+            code_line = sys.intern(step.code_line)
 
-        for step in steps:
             # Create enhanced step
             enhanced_step = ExecutionStep(
                 step_number=step.step_number,
-                code_line=step.code_line,
+                code_line=code_line,
                 variable_changes=step.variable_changes,
                 variables_before=getattr(step, 'variables_before', {}),
                 variables_after=getattr(step, 'variables_after', {}),
@@ -102,7 +138,7 @@ class StepExplainer:
             enhanced_step.visualization_data = self._generate_visualization_data(
                 enhanced_step, algorithm_pattern
             )
-            enhanced_steps.append(enhanced_step)
+            enhanced_steps[idx] = enhanced_step
 
         logger.info(f"Enhanced {len(enhanced_steps)} steps with explanations")
         return enhanced_steps
@@ -114,7 +150,7 @@ class StepExplainer:
             context: Dict[str, Any]
     ) -> str:
         """Generate AI explanation using algorithm-specific prompts"""
-        if not OLLAMA_AVAILABLE:
+        if self._client is None:
             raise Exception("Ollama not available")
 
         cache_key = self._create_cache_key(step, pattern)
@@ -132,9 +168,10 @@ class StepExplainer:
         )
 
         try:
-            response = ollama.chat(
+            response = self._client.chat(
                 model=self.model_name,
                 messages=[{"role": "user", "content": prompt}],
+                keep_alive=self.KEEP_ALIVE,
                 options={
                     "temperature": 0.1,
                     "max_tokens": 25,
@@ -222,57 +259,17 @@ class StepExplainer:
 
         return True
 
-    def _create_cache_key(self, step: ExecutionStep, pattern: AlgorithmPattern) -> str:
-        """Create secure cache key using SHA256"""
-        key_data = f"{step.code_line}_{pattern.value}_{len(step.variable_changes)}"
-        return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+    def _create_cache_key(self, step: ExecutionStep, pattern: AlgorithmPattern) -> Tuple[str, AlgorithmPattern, int]:
+        """Create cache key from the (interned) code line, pattern and change count"""
+        return (step.code_line, pattern, len(step.variable_changes))
 
     def _format_variable_changes(self, changes: Dict[str, Any]) -> str:
         """Format variable changes safely"""
-        if not changes:
-            return "No changes"
-
-        formatted = []
-        for var, value in list(changes.items())[:3]:  # Limit to 3 changes
-            safe_var = str(var)[:20]
-            safe_value = str(value)[:30]
-            formatted.append(f"{safe_var}={safe_value}")
-
-        result = ", ".join(formatted)
-        return result[:100] + "..." if len(result) > 100 else result
+        return format_variable_changes(changes)
 
     def _trim_explanation(self, explanation: str) -> str:
         """Trim explanation to ensure brevity"""
-        if not explanation:
-            return "Execute step"
-
-        # Remove verbose prefixes
-        prefixes_to_remove = [
-            "The algorithm", "In this step", "This operation", "The hash map",
-            "The two pointers", "We are", "This step", "Now we"
-        ]
-
-        cleaned = explanation.strip()
-        for prefix in prefixes_to_remove:
-            if cleaned.startswith(prefix):
-                cleaned = cleaned[len(prefix):].strip()
-                if cleaned.startswith(','):
-                    cleaned = cleaned[1:].strip()
-
-        # Take first sentence and limit words
-        sentences = re.split(r'[.!?]', cleaned)
-        if sentences:
-            first_sentence = sentences[0].strip()
-            words = first_sentence.split()[:15]  # Max 15 words
-            result = ' '.join(words)
-
-            # Ensure proper capitalization
-            if result and not result[0].isupper():
-                result = result[0].upper() + result[1:]
-
-            return result
-
-        return cleaned[:100] if cleaned else "Execute step"
+        return trim_explanation(explanation)
 
     def _generate_visualization_data(
             self,
@@ -292,16 +289,9 @@ class StepExplainer:
 
         # Extract data structures
         for var_name, var_value in variables_after.items():
-            if isinstance(var_value, (list, tuple)):
-                viz_data["data_structure_state"][var_name] = {
-                    "type": "array",
-                    "values": list(var_value)
-                }
-            elif isinstance(var_value, dict):
-                viz_data["data_structure_state"][var_name] = {
-                    "type": "hash_map",
-                    "entries": dict(var_value)
-                }
+            entry = emit_data_structure(self._viz_cache, var_name, var_value)
+            if entry is not None:
+                viz_data["data_structure_state"][var_name] = entry
 
         # Extract pointers
         pointer_vars = ['left', 'right', 'start', 'end', 'low', 'high', 'mid', 'i', 'j']
@@ -407,8 +397,8 @@ def get_step_explainer(llm_model: str = None) -> StepExplainer:
                 self.fallback = FallbackStepExplainer()
 
             def enhance_steps_with_explanations(self, steps, pattern, context):
-                enhanced_steps = []
-                for step in steps:
+                enhanced_steps = [None] * len(steps)
+                for idx, step in enumerate(steps):
                     # Create enhanced step with fallback explanation
                     enhanced_step = ExecutionStep(
                         step_number=step.step_number,
@@ -436,7 +426,7 @@ def get_step_explainer(llm_model: str = None) -> StepExplainer:
                         "highlights": []
                     }
 
-                    enhanced_steps.append(enhanced_step)
+                    enhanced_steps[idx] = enhanced_step
 
                 return enhanced_steps
 
@@ -1,6 +1,7 @@
 # Fallback step explainer when Ollama is not available
 from typing import List, Dict, Any
 from core.execution_tracker import ExecutionStep
+from core.viz_emitters import VizCache, emit_data_structure
 from models.internal_models import AlgorithmPattern
 from config.log_config import get_logger
 
@@ -11,15 +12,17 @@ class FallbackStepExplainer:
 
     def __init__(self):
         self.explanation_cache = {}
+        self._viz_cache: VizCache = {}
 
     def enhance_steps_with_explanations(self, steps: List[ExecutionStep], algorithm_pattern: AlgorithmPattern, problem_context: Dict[str, Any]) -> List[ExecutionStep]:
         """Add basic explanations to execution steps"""
-        enhanced_steps = []
+        enhanced_steps = [None] * len(steps)
+        self._viz_cache = {}
 
-        for step in steps:
+        for idx, step in enumerate(steps):
             step.explanation = self._generate_fallback_explanation(step, algorithm_pattern)
             step.visualization_data = self._generate_visualization_data(step, algorithm_pattern)
-            enhanced_steps.append(step)
+            enhanced_steps[idx] = step
 
         logger.info(f"Enhanced {len(enhanced_steps)} steps with fallback explanations")
         return enhanced_steps
@@ -69,18 +72,9 @@ class FallbackStepExplainer:
 
         # Extract data structures from variables
         for var_name, var_value in step.variables_after.items():
-            if isinstance(var_value, (list, tuple)):
-                viz_data['data_structure_state'][var_name] = {
-                    'type': 'array',
-                    'values': list(var_value),
-                    'length': len(var_value)
-                }
-            elif isinstance(var_value, dict):
-                viz_data['data_structure_state'][var_name] = {
-                    'type': 'hash_map',
-                    'entries': dict(var_value),
-                    'size': len(var_value)
-                }
+            entry = emit_data_structure(self._viz_cache, var_name, var_value, sized=True)
+            if entry is not None:
+                viz_data['data_structure_state'][var_name] = entry
 
         # Add pointer information
         pointer_vars = ['left', 'right', 'start', 'end', 'low', 'high', 'mid', 'i', 'j']
@@ -92,4 +86,4 @@ class FallbackStepExplainer:
         for var_name in step.variable_changes:
             viz_data['highlights'].append(var_name)
 
-        return viz_data
\ No newline at end of file
+        return viz_data
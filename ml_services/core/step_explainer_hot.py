@@ -0,0 +1,65 @@
+# ml_services/core/step_explainer_hot.py
+# Pure, fully typed string helpers used per step / per LLM response by StepExplainer.
+# Kept free of project imports so the module can be compiled with mypyc:
+#
+#     cd ml_services && mypyc core/step_explainer_hot.py
+#
+# When the compiled extension is present it shadows this file on import;
+# otherwise the pure-Python version below is used unchanged.
+import re
+from typing import Any, Dict, List
+
+_SENTENCE_END = re.compile(r'[.!?]')
+
+# Verbose prefixes stripped from LLM responses
+_VERBOSE_PREFIXES = (
+    "The algorithm", "In this step", "This operation", "The hash map",
+    "The two pointers", "We are", "This step", "Now we"
+)
+
+
+def format_variable_changes(changes: Dict[str, Any]) -> str:
+    """Format variable changes safely"""
+    if not changes:
+        return "No changes"
+
+    # Single pass over at most 3 changes, tracking the joined length as we go
+    formatted: List[str] = []
+    total = -2  # no ", " before the first entry
+    for var, value in changes.items():
+        part = f"{str(var)[:20]}={str(value)[:30]}"
+        formatted.append(part)
+        total += len(part) + 2
+        if len(formatted) == 3 or total > 100:
+            break
+
+    result = ", ".join(formatted)
+    return result[:100] + "..." if total > 100 else result
+
+
+def trim_explanation(explanation: str) -> str:
+    """Trim explanation to ensure brevity"""
+    if not explanation:
+        return "Execute step"
+
+    cleaned = explanation.strip()
+    for prefix in _VERBOSE_PREFIXES:
+        if cleaned.startswith(prefix):
+            cleaned = cleaned[len(prefix):].strip()
+            if cleaned.startswith(','):
+                cleaned = cleaned[1:].strip()
+
+    # Take first sentence and limit words
+    sentences = _SENTENCE_END.split(cleaned)
+    if sentences:
+        first_sentence = sentences[0].strip()
+        words = first_sentence.split()[:15]  # Max 15 words
+        result = ' '.join(words)
+
+        # Ensure proper capitalization
+        if result and not result[0].isupper():
+            result = result[0].upper() + result[1:]
+
+        return result
+
+    return cleaned[:100] if cleaned else "Execute step"
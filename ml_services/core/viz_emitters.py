@@ -0,0 +1,58 @@
+# ml_services/core/viz_emitters.py
+# Visualization entries for array / hash map variables, shared by StepExplainer
+# and FallbackStepExplainer.
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Per-run map of var_name -> (last value, emitted viz entry)
+VizCache = Dict[str, Tuple[Any, Dict[str, Any]]]
+
+
+def _emit_array(values) -> Dict[str, Any]:
+    return {'type': 'array', 'values': tuple(values)}
+
+
+def _emit_hash_map(entries) -> Dict[str, Any]:
+    return {'type': 'hash_map', 'entries': dict(entries)}
+
+
+def _emit_sized_array(values) -> Dict[str, Any]:
+    return {'type': 'array', 'values': tuple(values), 'length': len(values)}
+
+
+def _emit_sized_hash_map(entries) -> Dict[str, Any]:
+    return {'type': 'hash_map', 'entries': dict(entries), 'size': len(entries)}
+
+
+# Exact-type dispatch for visualization entries (avoids isinstance MRO walks)
+_VIZ_EMITTERS = {list: _emit_array, tuple: _emit_array, dict: _emit_hash_map}
+_SIZED_VIZ_EMITTERS = {list: _emit_sized_array, tuple: _emit_sized_array, dict: _emit_sized_hash_map}
+
+
+def _subclass_emitter(value, emitters: Dict[type, Callable]) -> Optional[Callable]:
+    """Emitter for list/tuple/dict subclasses missed by the exact-type table"""
+    if isinstance(value, (list, tuple)):
+        return emitters[list]
+    if isinstance(value, dict):
+        return emitters[dict]
+    return None
+
+
+def emit_data_structure(viz_cache: VizCache, var_name: str, var_value: Any,
+                        sized: bool = False) -> Optional[Dict[str, Any]]:
+    """Build the viz entry for an array/hash map, reusing the previous step's entry if unchanged.
+
+    viz_cache maps var_name -> (last value, emitted entry) for the current run;
+    sized adds 'length' / 'size' fields to the entry.
+    """
+    emitters = _SIZED_VIZ_EMITTERS if sized else _VIZ_EMITTERS
+    emit = emitters.get(type(var_value)) or _subclass_emitter(var_value, emitters)
+    if emit is None:
+        return None
+
+    cached = viz_cache.get(var_name)
+    if cached is not None and type(cached[0]) is type(var_value) and cached[0] == var_value:
+        return cached[1]
+
+    entry = emit(var_value)
+    viz_cache[var_name] = (var_value, entry)
+    return entry
@@ -0,0 +1,161 @@
+# ml_services/data/sample_reference.py
+import ast
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from data.training_data_builder import TrainingDataBuilder
+from config.log_config import get_logger
+
+logger = get_logger(__name__)
+
+# Try to import numba, fallback if not available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("Numba not available, reference kernels will run as plain NumPy/Python")
+
+
+def _kernel(fn):
+    """Compile a scalar-loop kernel with numba when available"""
+    return njit(cache=True)(fn) if NUMBA_AVAILABLE else fn
+
+
+# Reference implementations of the numeric DP / greedy training samples.
+# Inputs are int64 arrays, so results only agree with the samples while they fit in 64 bits.
+
+@_kernel
+def _candy_passes(ratings, candies):
+    n = ratings.shape[0]
+    for i in range(1, n):
+        if ratings[i] > ratings[i - 1]:
+            candies[i] = candies[i - 1] + 1
+    for i in range(n - 2, -1, -1):
+        if ratings[i] > ratings[i + 1] and candies[i] <= candies[i + 1]:
+            candies[i] = candies[i + 1] + 1
+
+
+def candy(ratings) -> int:
+    r = np.asarray(ratings, dtype=np.int64)
+    candies = np.ones(r.shape[0], dtype=np.int64)
+    _candy_passes(r, candies)
+    return int(candies.sum())
+
+
+@_kernel
+def _rob(nums):
+    prev, curr = 0, 0
+    for x in nums:
+        prev, curr = curr, max(curr, prev + x)
+    return curr
+
+
+def rob(nums) -> int:
+    return int(_rob(np.asarray(nums, dtype=np.int64)))
+
+
+@_kernel
+def _max_subarray(nums):
+    best = here = nums[0]
+    for i in range(1, nums.shape[0]):
+        here = max(nums[i], here + nums[i])
+        best = max(best, here)
+    return best
+
+
+def max_subarray(nums) -> int:
+    return int(_max_subarray(np.asarray(nums, dtype=np.int64)))
+
+
+@_kernel
+def _coin_change(coins, amount):
+    dp = np.full(amount + 1, amount + 1, dtype=np.int64)
+    dp[0] = 0
+    for i in range(1, amount + 1):
+        for coin in coins:
+            if coin <= i and dp[i - coin] + 1 < dp[i]:
+                dp[i] = dp[i - coin] + 1
+    return dp[amount] if dp[amount] != amount + 1 else -1
+
+
+def coin_change(coins, amount) -> int:
+    return int(_coin_change(np.asarray(coins, dtype=np.int64), amount))
+
+
+@_kernel
+def _length_of_lis(nums):
+    n = nums.shape[0]
+    dp = np.ones(n, dtype=np.int64)
+    for i in range(1, n):
+        for j in range(i):
+            if nums[i] > nums[j] and dp[j] + 1 > dp[i]:
+                dp[i] = dp[j] + 1
+    return dp.max()
+
+
+def length_of_lis(nums) -> int:
+    if len(nums) == 0:
+        return 0
+    return int(_length_of_lis(np.asarray(nums, dtype=np.int64)))
+
+
+def unique_paths(m: int, n: int) -> int:
+    # Each grid row is the running sum of the row above
+    row = np.ones(n, dtype=np.int64)
+    for _ in range(1, m):
+        np.cumsum(row, out=row)
+    return int(row[-1])
+
+
+def knapsack(weights, values, capacity: int) -> int:
+    # One vectorized row update per item over a rolling capacity vector
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    for w, v in zip(weights, values):
+        if 0 < w <= capacity:
+            dp[w:] = np.maximum(dp[w:], dp[:-w] + v)
+        elif w == 0:
+            dp[1:] += v
+    return int(dp[capacity])
+
+
+# Sample function name -> reference implementation
+REFERENCE_IMPLEMENTATIONS: Dict[str, Callable] = {
+    'candy': candy,
+    'rob': rob,
+    'max_subarray': max_subarray,
+    'coin_change': coin_change,
+    'length_of_lis': length_of_lis,
+    'unique_paths': unique_paths,
+    'knapsack': knapsack,
+}
+
+
+@lru_cache(maxsize=None)
+def _sample_function(func_name: str) -> Optional[Callable]:
+    """Compile the training sample that defines func_name"""
+    for tree, _, _ in TrainingDataBuilder.parsed_samples():
+        if tree is None:
+            continue
+        if any(isinstance(node, ast.FunctionDef) and node.name == func_name for node in tree.body):
+            namespace: Dict[str, object] = {}
+            exec(compile(tree, f"<sample:{func_name}>", "exec"), namespace)
+            return namespace[func_name]
+    return None
+
+
+def check_against_reference(func_name: str, *args) -> bool:
+    """Run a training sample and its NumPy reference on the same input and compare results"""
+    reference = REFERENCE_IMPLEMENTATIONS.get(func_name)
+    sample = _sample_function(func_name)
+    if reference is None or sample is None:
+        raise KeyError(f"No reference implementation for sample {func_name}")
+
+    expected = reference(*args)
+    actual = sample(*args)
+    if actual != expected:
+        logger.warning(f"Sample {func_name}{args} returned {actual}, reference gave {expected}")
+        return False
+    return True
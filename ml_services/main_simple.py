@@ -1,17 +1,133 @@
 # Simple main.py without complex dependencies
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
 import urllib.parse
 
+# Optional fast JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+# Optional JIT for the binary search trace; the server runs without it
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Trace row layout: (step_number, left, right, mid, action)
+_ROW = 5
+_INIT, _MID, _FOUND, _GO_RIGHT, _GO_LEFT = range(5)
+_MAX_STEP = 10
+_MAX_ROWS = 2 * _MAX_STEP
+
+# Step skeletons per trace action; copied and filled in per row
+_STEP_TEMPLATES = {
+    action: {"step_number": 0, "code_line": code_line, "explanation": "",
+             "variables_after": None, "variable_changes": None}
+    for action, code_line in (
+        (_INIT, "left, right = 0, len(arr) - 1"),
+        (_MID, "mid = (left + right) // 2"),
+        (_FOUND, "return mid"),
+        (_GO_RIGHT, "left = mid + 1"),
+        (_GO_LEFT, "right = mid - 1"),
+    )
+}
+
+# detect_algorithm() result -> response pattern name
+_PATTERN_NAMES = {
+    'Binary Search': 'BINARY_SEARCH',
+    'Two Pointers': 'TWO_POINTERS',
+    'Hash Map': 'HASH_MAP',
+    'Unknown Algorithm': 'UNKNOWN_ALGORITHM',
+}
+
+
+def _bsearch_trace(arr, target, out):
+    """Run binary search, writing one flat trace row per step into out; returns row count"""
+    left, right = 0, len(arr) - 1
+    out[0] = 0
+    out[1] = left
+    out[2] = right
+    out[3] = -1
+    out[4] = _INIT
+    n = 1
+    step_num = 1
+    while left <= right and step_num < _MAX_STEP:
+        mid = (left + right) // 2
+        base = n * _ROW
+        out[base] = step_num
+        out[base + 1] = left
+        out[base + 2] = right
+        out[base + 3] = mid
+        out[base + 4] = _MID
+        n += 1
+        step_num += 1
+
+        if arr[mid] == target:
+            action = _FOUND
+        elif arr[mid] < target:
+            left = mid + 1
+            action = _GO_RIGHT
+        else:
+            right = mid - 1
+            action = _GO_LEFT
+
+        base = n * _ROW
+        out[base] = step_num
+        out[base + 1] = left
+        out[base + 2] = right
+        out[base + 3] = mid
+        out[base + 4] = action
+        n += 1
+        if action == _FOUND:
+            break
+        step_num += 1
+    return n
+
+
+_bsearch_trace_jit = njit(cache=True)(_bsearch_trace) if NUMBA_AVAILABLE else None
+
+# Python ints outside this range overflow when passed to the JIT kernel
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _trace_rows(array, target):
+    """Trace rows for a binary search, JIT-compiled when the input is a flat numeric array"""
+    if NUMBA_AVAILABLE and (isinstance(target, float)
+                            or (isinstance(target, int) and _INT64_MIN <= target <= _INT64_MAX)):
+        arr = np.asarray(array)
+        if arr.ndim == 1 and arr.dtype.kind in 'iuf':
+            out = np.empty(_MAX_ROWS * _ROW, np.int64)
+            n = _bsearch_trace_jit(arr, target, out)
+            return out[:n * _ROW].tolist()
+
+    out = [0] * (_MAX_ROWS * _ROW)
+    n = _bsearch_trace(array, target, out)
+    return out[:n * _ROW]
+
 class SimpleMLHandler(BaseHTTPRequestHandler):
+    # Headers sent with every JSON response
+    _CORS = (('Content-type', 'application/json'), ('Access-Control-Allow-Origin', '*'))
+
+    def _send_json(self, status, payload):
+        """Write a JSON response with the shared headers"""
+        body = _dumps(payload)
+        self.send_response(status)
+        for key, value in self._CORS:
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_GET(self):
         if self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            response = {"status": "healthy", "service": "ml_services"}
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(200, {"status": "healthy", "service": "ml_services"})
         else:
             self.send_response(404)
             self.end_headers()
@@ -22,7 +138,7 @@ class SimpleMLHandler(BaseHTTPRequestHandler):
             post_data = self.rfile.read(content_length)
             
             try:
-                request_data = json.loads(post_data.decode('utf-8'))
+                request_data = _loads(post_data)
                 code = request_data.get('code', '')
                 
                 # Simple algorithm detection
@@ -32,7 +148,7 @@ class SimpleMLHandler(BaseHTTPRequestHandler):
                 response = {
                     "status": "success",
                     "algorithm_analysis": {
-                        "primary_pattern": algorithm.upper().replace(' ', '_'),
+                        "primary_pattern": _PATTERN_NAMES[algorithm],
                         "confidence_score": 0.8,
                         "execution_steps": steps,
                         "complexity_analysis": {
@@ -43,19 +159,10 @@ class SimpleMLHandler(BaseHTTPRequestHandler):
                     "processing_time": 0.1
                 }
                 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(response).encode())
+                self._send_json(200, response)
                 
             except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                error_response = {"error": str(e)}
-                self.wfile.write(json.dumps(error_response).encode())
+                self._send_json(500, {"error": str(e)})
         else:
             self.send_response(404)
             self.end_headers()
@@ -83,10 +190,9 @@ class SimpleMLHandler(BaseHTTPRequestHandler):
         array = input_data.get('nums', [1, 3, 5, 7, 9, 11])
         target = input_data.get('target', 7)
         
-        if algorithm == 'Binary Search':
-            return self.generate_binary_search_steps(array, target)
-        elif algorithm == 'Two Pointers':
-            return self.generate_two_pointers_steps(array, target)
+        generate = self._DISPATCH.get(algorithm)
+        if generate is not None:
+            return generate(self, array, target)
         
         return [{
             "step_number": 1,
@@ -97,64 +203,44 @@ class SimpleMLHandler(BaseHTTPRequestHandler):
         }]
 
     def generate_binary_search_steps(self, array, target):
+        rows = _trace_rows(array, target)
         steps = []
-        left, right = 0, len(array) - 1
-        step_num = 0
-        
-        steps.append({
-            "step_number": step_num,
-            "code_line": "left, right = 0, len(arr) - 1",
-            "explanation": f"Initialize: left={left}, right={right}",
-            "variables_after": {"arr": array, "target": target, "left": left, "right": right},
-            "variable_changes": {"left": left, "right": right}
-        })
-        
-        step_num += 1
-        while left <= right and step_num < 10:
-            mid = (left + right) // 2
-            
-            steps.append({
-                "step_number": step_num,
-                "code_line": f"mid = (left + right) // 2",
-                "explanation": f"Calculate mid = ({left} + {right}) // 2 = {mid}",
-                "variables_after": {"arr": array, "target": target, "left": left, "right": right, "mid": mid},
-                "variable_changes": {"mid": mid}
-            })
-            
-            step_num += 1
-            if array[mid] == target:
-                steps.append({
-                    "step_number": step_num,
-                    "code_line": "return mid",
-                    "explanation": f"Found! arr[{mid}] = {array[mid]} equals target {target}",
-                    "variables_after": {"arr": array, "target": target, "left": left, "right": right, "mid": mid},
-                    "variable_changes": {}
-                })
-                break
-            elif array[mid] < target:
-                left = mid + 1
-                steps.append({
-                    "step_number": step_num,
-                    "code_line": "left = mid + 1",
-                    "explanation": f"arr[{mid}] = {array[mid]} < {target}, search right half",
-                    "variables_after": {"arr": array, "target": target, "left": left, "right": right, "mid": mid},
-                    "variable_changes": {"left": left}
-                })
+        for base in range(0, len(rows), _ROW):
+            step_num, left, right, mid, action = rows[base:base + _ROW]
+            step = _STEP_TEMPLATES[action].copy()
+            step["step_number"] = step_num
+            variables = {"arr": array, "target": target, "left": left, "right": right}
+
+            if action == _INIT:
+                step["explanation"] = f"Initialize: left={left}, right={right}"
+                step["variable_changes"] = {"left": left, "right": right}
             else:
-                right = mid - 1
-                steps.append({
-                    "step_number": step_num,
-                    "code_line": "right = mid - 1",
-                    "explanation": f"arr[{mid}] = {array[mid]} > {target}, search left half",
-                    "variables_after": {"arr": array, "target": target, "left": left, "right": right, "mid": mid},
-                    "variable_changes": {"right": right}
-                })
-            step_num += 1
+                variables["mid"] = mid
+                if action == _MID:
+                    step["explanation"] = f"Calculate mid = ({left} + {right}) // 2 = {mid}"
+                    step["variable_changes"] = {"mid": mid}
+                elif action == _FOUND:
+                    step["explanation"] = f"Found! arr[{mid}] = {array[mid]} equals target {target}"
+                    step["variable_changes"] = {}
+                elif action == _GO_RIGHT:
+                    step["explanation"] = f"arr[{mid}] = {array[mid]} < {target}, search right half"
+                    step["variable_changes"] = {"left": left}
+                else:
+                    step["explanation"] = f"arr[{mid}] = {array[mid]} > {target}, search left half"
+                    step["variable_changes"] = {"right": right}
+
+            step["variables_after"] = variables
+            steps.append(step)
         
         return steps
 
+    # detect_algorithm() result -> step generator
+    _DISPATCH = {
+        'Binary Search': generate_binary_search_steps,
+    }
+
 if __name__ == "__main__":
-    server = HTTPServer(('localhost', 8001), SimpleMLHandler)
+    server = ThreadingHTTPServer(('localhost', 8001), SimpleMLHandler)
     print("Simple ML Service running on http://localhost:8001")
     print("Health check: http://localhost:8001/health")
     server.serve_forever()
\ No newline at end of file
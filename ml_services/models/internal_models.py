@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 import ast
 
@@ -109,8 +109,7 @@ class ProcessedInput(BaseModel):
     code_structure: Optional[CodeStructureAnalysis] = None
     algorithm_analysis: Optional[AlgorithmAnalysis] = None
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 # Additional models for Phase 2 enhancements
 class PatternMatchingResult(BaseModel):
@@ -135,4 +134,10 @@ class CodeQualityMetrics(BaseModel):
     efficiency_score: float
     correctness_probability: float
     maintainability_score: float
-    test_coverage_estimate: float
\ No newline at end of file
+    test_coverage_estimate: float
+
+# Enum member -> wire string, resolved once at import instead of per-field .value lookups
+LANGUAGE_STR = {m: m.value for m in Language}
+PROBLEM_TYPE_STR = {m: m.value for m in ProblemType}
+ALGO_PATTERN_STR = {m: m.value for m in AlgorithmPattern}
+DATA_STRUCTURE_STR = {m: m.value for m in DataStructureType}
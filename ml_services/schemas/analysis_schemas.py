@@ -1,5 +1,5 @@
 # ml_services/schemas/analysis_schemas.py - Enhanced with Phase 2 Response Models
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any, Union
 from models.internal_models import Language, AlgorithmPattern, ProblemType, DataStructureType
 
@@ -13,7 +13,8 @@ class CodeAnalysisRequest(BaseModel):
     language: Language = Field(default=Language.PYTHON, description="Programming language")
     test_cases: Optional[List[TestCaseInput]] = Field(default=[], description="Optional test cases")
 
-    @validator("code_string", "problem_statement")
+    @field_validator("code_string", "problem_statement")
+    @classmethod
     def not_empty(cls, v):
         if not v or not v.strip():
             raise ValueError("Field cannot be empty")
@@ -68,6 +69,16 @@ class CodeAnalysisResponse(BaseModel):
     # Phase 2 Results
     algorithm_analysis: Union[AlgorithmAnalysisResponse, AlgorithmAnalysisErrorResponse]
 
+# Batch Models
+class BatchAnalysisItem(CodeAnalysisRequest):
+    name: Optional[str] = Field(default=None, description="Caller-chosen label echoed back in the result")
+
+class BatchAnalysisResult(BaseModel):
+    name: Optional[str] = Field(default=None, description="Label of the matching request item")
+    status_code: int = Field(description="Status the single-item endpoint would have returned")
+    result: Optional[CodeAnalysisResponse] = Field(default=None, description="Analysis result on success")
+    error: Optional[Any] = Field(default=None, description="Error detail on failure")
+
 # Debug Response Models
 class CodeStructureDebug(BaseModel):
     functions: List[Dict[str, Any]] = Field(description="Function analysis details")
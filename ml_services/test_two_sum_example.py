@@ -1,6 +1,6 @@
 # test_two_sum_example.py
-import ast
 from core.execution_simulator import ExecutionSimulator
+from utils.ast_cache import parse_cached
 from models.internal_models import (
     ProcessedInput, ProblemData, CodeMetadata, TestCase, AlgorithmPattern, Language, ProblemType
 )
@@ -12,17 +12,13 @@ def test_two_sum_solution():
     code = '''
 def twoSum(nums, target):
     numMap = {}
-    n = len(nums)
 
-    # Build the hash table
-    for i in range(n):
-        numMap[nums[i]] = i
-
-    # Find the complement
-    for i in range(n):
-        complement = target - nums[i]
-        if complement in numMap and numMap[complement] != i:
-            return [i, numMap[complement]]
+    # Look up the complement, then record the current number
+    for i, num in enumerate(nums):
+        complement = target - num
+        if complement in numMap:
+            return [numMap[complement], i]
+        numMap[num] = i
 
     return []
 
@@ -43,7 +39,7 @@ print(f"Result: {result}")
         cleaned_code=code,
         problem_data=ProblemData(
             title="Two Sum - Hash Map Approach",
-            description="Find two indices of numbers that add up to target using hash table with two passes",
+            description="Find two indices of numbers that add up to target using a hash table in a single pass",
             problem_type=ProblemType.ARRAY,
             constraints=[],
             test_cases=[test_case]
@@ -52,12 +48,12 @@ print(f"Result: {result}")
             language=Language.PYTHON,
             function_name="twoSum",
             parameters=["nums", "target"],
-            lines_of_code=len(code.split('\n')),
+            lines_of_code=code.count('\n') + 1,
             cyclomatic_complexity=2
         ),
         selected_test_case=test_case,
         validation_errors=[],
-        code_ast=ast.parse(code)
+        code_ast=parse_cached(code)
     )
 
     # Run Phase 3 + 4 simulation
@@ -9,7 +9,7 @@ sys.path.insert(0, project_root)
 # Now your imports will work
 from ml_services.core.ai_pattern_matcher import AIPatternMatcher
 from ml_services.data.training_data_builder import TrainingDataBuilder
-import ast
+from ml_services.utils.ast_cache import parse_cached
 def test_ai_pattern_matcher():
     print("🤖 Testing AI Pattern Matcher")
 
@@ -35,7 +35,7 @@ def two_sum(nums, target):
     return []
 """
 
-    tree = ast.parse(test_code)
+    tree = parse_cached(test_code)
     pattern, confidence = matcher.predict_pattern(tree, test_code)
     print(f"Predicted: {pattern} (confidence: {confidence:.3f})")
 
@@ -1,7 +1,30 @@
 # test_phase2.py - Comprehensive test suite for Phase 2 functionality
 
 import json
+import sys
+from types import MappingProxyType
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson works on bytes in both directions; fall back to the stdlib codec
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+# One keep-alive session for every request in the suite
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+_session.headers.update({"Content-Type": "application/json"})
 
 # Test cases for different algorithm patterns
 test_cases = {
@@ -127,6 +150,89 @@ test_cases = {
     }
 }
 
+# Read-only from here on; code strings are interned so repeated lookups compare by identity
+test_cases = MappingProxyType({
+    sys.intern(name): MappingProxyType({**data, "code_string": sys.intern(data["code_string"])})
+    for name, data in test_cases.items()
+})
+
+def _record(test_name, test_data, status_code, result, error_text):
+    """Turn one analysis response into its result dict and the lines to print for it"""
+    lines = [f"\n📝 Testing: {test_name}", f"Expected Pattern: {test_data['expected_pattern']}"]
+
+    if status_code == 202:
+        algorithm_analysis = result.get("algorithm_analysis", {})
+
+        detected_pattern = algorithm_analysis.get("primary_pattern")
+        confidence = algorithm_analysis.get("confidence_score", 0)
+        alignment = algorithm_analysis.get("problem_alignment", 0)
+
+        # Check if detection was successful
+        pattern_match = detected_pattern == test_data["expected_pattern"]
+
+        status_icon = "✅" if pattern_match else "❌"
+        lines.append(f"  {status_icon} Detected: {detected_pattern} (confidence: {confidence:.3f})")
+        lines.append(f"     Alignment: {alignment:.3f}")
+        lines.append(f"     Data Structures: {algorithm_analysis.get('data_structures_used', [])}")
+        lines.append(f"     Complexity: {algorithm_analysis.get('time_complexity', 'N/A')} time, {algorithm_analysis.get('space_complexity', 'N/A')} space")
+
+        return {
+            "expected": test_data["expected_pattern"],
+            "detected": detected_pattern,
+            "confidence": confidence,
+            "alignment": alignment,
+            "pattern_match": pattern_match,
+            "status": "success"
+        }, lines
+
+    lines.append(f"  ❌ Request failed: {status_code}")
+    lines.append(f"     Error: {error_text}")
+    return {
+        "status": "failed",
+        "error": error_text
+    }, lines
+
+def _exception_outcome(test_name, test_data, e):
+    """Result dict and output lines for a request that raised"""
+    return {
+        "status": "exception",
+        "error": str(e)
+    }, [f"\n📝 Testing: {test_name}", f"Expected Pattern: {test_data['expected_pattern']}", f"  ❌ Exception: {e}"]
+
+def _run_one(base_url, test_name, test_data):
+    """Run one analysis request; returns its result and the lines to print for it"""
+    try:
+        # Send request to analysis endpoint
+        response = _session.post(
+            f"{base_url}/analysis/",
+            data=_prebuilt[test_name]
+        )
+        result = _loads(response.content) if response.status_code == 202 else None
+        return _record(test_name, test_data, response.status_code, result, response.text)
+
+    except Exception as e:
+        return _exception_outcome(test_name, test_data, e)
+
+def _run_batch(base_url):
+    """Send every test case in one /analysis/batch request; None if the server lacks the route"""
+    try:
+        response = _session.post(f"{base_url}/analysis/batch", data=_batch_body)
+        if response.status_code != 200:
+            return None
+        entries = {entry.get("name"): entry for entry in _loads(response.content)}
+    except Exception:
+        return None
+
+    outcomes = []
+    for test_name, test_data in test_cases.items():
+        entry = entries.get(test_name)
+        if entry is None:
+            outcomes.append(_exception_outcome(test_name, test_data, "missing from batch response"))
+            continue
+        error_text = json.dumps(entry.get("error"))
+        outcomes.append(_record(test_name, test_data, entry["status_code"], entry.get("result"), error_text))
+    return outcomes
+
 def test_phase2_analysis(base_url="http://127.0.0.1:8001"):
     """Test Phase 2 analysis with different algorithm patterns"""
 
@@ -135,87 +241,41 @@ def test_phase2_analysis(base_url="http://127.0.0.1:8001"):
 
     results = {}
 
-    for test_name, test_data in test_cases.items():
-        print(f"\n📝 Testing: {test_name}")
-        print(f"Expected Pattern: {test_data['expected_pattern']}")
-
-        # Prepare request
-        request_data = {
-            "code_string": test_data["code_string"],
-            "problem_statement": test_data["problem_statement"],
-            "language": "python",
-            "test_cases": []
-        }
+    # One batched request when the server supports it, otherwise concurrent single requests
+    outcomes = _run_batch(base_url)
+    if outcomes is None:
+        with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+            outcomes = list(executor.map(
+                lambda item: _run_one(base_url, *item), test_cases.items()
+            ))
 
-        try:
-            # Send request to analysis endpoint
-            response = requests.post(
-                f"{base_url}/analysis/",
-                json=request_data,
-                headers={"Content-Type": "application/json"}
-            )
-
-            if response.status_code == 202:
-                result = response.json()
-                algorithm_analysis = result.get("algorithm_analysis", {})
-
-                detected_pattern = algorithm_analysis.get("primary_pattern")
-                confidence = algorithm_analysis.get("confidence_score", 0)
-                alignment = algorithm_analysis.get("problem_alignment", 0)
-
-                # Check if detection was successful
-                pattern_match = detected_pattern == test_data["expected_pattern"]
-
-                results[test_name] = {
-                    "expected": test_data["expected_pattern"],
-                    "detected": detected_pattern,
-                    "confidence": confidence,
-                    "alignment": alignment,
-                    "pattern_match": pattern_match,
-                    "status": "success"
-                }
-
-                # Print results
-                status_icon = "✅" if pattern_match else "❌"
-                print(f"  {status_icon} Detected: {detected_pattern} (confidence: {confidence:.3f})")
-                print(f"     Alignment: {alignment:.3f}")
-                print(f"     Data Structures: {algorithm_analysis.get('data_structures_used', [])}")
-                print(f"     Complexity: {algorithm_analysis.get('time_complexity', 'N/A')} time, {algorithm_analysis.get('space_complexity', 'N/A')} space")
-
-            else:
-                print(f"  ❌ Request failed: {response.status_code}")
-                print(f"     Error: {response.text}")
-                results[test_name] = {
-                    "status": "failed",
-                    "error": response.text
-                }
-
-        except Exception as e:
-            print(f"  ❌ Exception: {e}")
-            results[test_name] = {
-                "status": "exception",
-                "error": str(e)
-            }
+    # Per-test output and the summary are written in one go, in test_cases order
+    out = []
+    for test_name, (result, lines) in zip(test_cases, outcomes):
+        results[test_name] = result
+        out.extend(lines)
 
     # Summary
-    print("\n" + "=" * 60)
-    print("📊 PHASE 2 TEST SUMMARY")
-    print("=" * 60)
+    out.append("\n" + "=" * 60)
+    out.append("📊 PHASE 2 TEST SUMMARY")
+    out.append("=" * 60)
 
     successful_tests = [r for r in results.values() if r.get("status") == "success"]
     correct_detections = [r for r in successful_tests if r.get("pattern_match")]
 
-    print(f"Total Tests: {len(test_cases)}")
-    print(f"Successful Requests: {len(successful_tests)}")
-    print(f"Correct Pattern Detections: {len(correct_detections)}")
-    print(f"Accuracy: {len(correct_detections)/len(test_cases)*100:.1f}%")
+    out.append(f"Total Tests: {len(test_cases)}")
+    out.append(f"Successful Requests: {len(successful_tests)}")
+    out.append(f"Correct Pattern Detections: {len(correct_detections)}")
+    out.append(f"Accuracy: {len(correct_detections)/len(test_cases)*100:.1f}%")
 
     # Detailed results
     if successful_tests:
         avg_confidence = sum(r.get("confidence", 0) for r in successful_tests) / len(successful_tests)
         avg_alignment = sum(r.get("alignment", 0) for r in successful_tests) / len(successful_tests)
-        print(f"Average Confidence: {avg_confidence:.3f}")
-        print(f"Average Alignment: {avg_alignment:.3f}")
+        out.append(f"Average Confidence: {avg_confidence:.3f}")
+        out.append(f"Average Alignment: {avg_alignment:.3f}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
     return results
 
@@ -225,24 +285,15 @@ def test_debug_endpoint(base_url="http://127.0.0.1:8001"):
     print("\n🔍 Testing Debug Endpoint")
     print("=" * 40)
 
-    # Use the hash map example for debug testing
-    test_data = test_cases["hash_map_two_sum"]
-    request_data = {
-        "code_string": test_data["code_string"],
-        "problem_statement": test_data["problem_statement"],
-        "language": "python",
-        "test_cases": []
-    }
-
     try:
-        response = requests.post(
+        # Use the hash map example for debug testing
+        response = _session.post(
             f"{base_url}/analysis/debug",
-            json=request_data,
-            headers={"Content-Type": "application/json"}
+            data=_prebuilt["hash_map_two_sum"]
         )
 
         if response.status_code == 200:
-            debug_info = response.json()
+            debug_info = _loads(response.content)
 
             print("✅ Debug endpoint successful")
             print(f"Phase 1 Info:")
@@ -278,10 +329,10 @@ def test_supported_patterns(base_url="http://127.0.0.1:8001"):
     print("=" * 40)
 
     try:
-        response = requests.get(f"{base_url}/analysis/patterns")
+        response = _session.get(f"{base_url}/analysis/patterns")
 
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             print("✅ Supported patterns retrieved successfully")
             print(f"Algorithm Patterns: {data.get('algorithm_patterns', [])}")
             print(f"Problem Types: {data.get('problem_types', [])}")
@@ -294,6 +345,28 @@ def test_supported_patterns(base_url="http://127.0.0.1:8001"):
     except Exception as e:
         print(f"❌ Exception: {e}")
 
+def test_batch_limit(base_url="http://127.0.0.1:8001", max_items=32):
+    """Oversized batches must be rejected up front with 413"""
+
+    print("\n📦 Testing Batch Size Limit")
+    print("=" * 40)
+
+    try:
+        response = _session.post(
+            f"{base_url}/analysis/batch",
+            data=_dumps([create_test_request()] * (max_items + 1))
+        )
+
+        if response.status_code == 413:
+            print(f"✅ Oversized batch rejected: {_loads(response.content).get('detail')}")
+        elif response.status_code == 404:
+            print("⚠️ Server has no /analysis/batch route, skipping")
+        else:
+            print(f"❌ Expected 413, got {response.status_code}")
+
+    except Exception as e:
+        print(f"❌ Exception: {e}")
+
 def run_comprehensive_phase2_test():
     """Run all Phase 2 tests"""
 
@@ -311,9 +384,15 @@ def run_comprehensive_phase2_test():
     # Test 3: Supported patterns endpoint
     test_supported_patterns(base_url)
 
+    # Test 4: Batch size limit
+    test_batch_limit(base_url)
+
     print(f"\n🎯 All tests completed!")
     return results
 
+# Fields shared by every request; the empty tuple serializes as []
+_REQ_TEMPLATE = {"language": "python", "test_cases": ()}
+
 # Additional utility functions for manual testing
 def create_test_request(pattern_type="hash_map"):
     """Create a test request for manual testing"""
@@ -322,11 +401,14 @@ def create_test_request(pattern_type="hash_map"):
         return {
             "code_string": test_data["code_string"],
             "problem_statement": test_data["problem_statement"],
-            "language": "python",
-            "test_cases": []
+            **_REQ_TEMPLATE
         }
     return None
 
+# Request bodies serialized once at import; every run posts the same bytes
+_prebuilt = {name: _dumps(create_test_request(name)) for name in test_cases}
+_batch_body = _dumps([{"name": name, **create_test_request(name)} for name in test_cases])
+
 def format_analysis_response(response_json):
     """Format analysis response for better readability"""
     if "algorithm_analysis" in response_json:
@@ -1,6 +1,6 @@
 # test_phase3_execution.py - FIXED VERSION
-import ast
 from core.execution_simulator import ExecutionSimulator
+from utils.ast_cache import parse_cached
 from models.internal_models import (
     ProcessedInput, ProblemData, TestCase, AlgorithmPattern, CodeMetadata
 )
@@ -34,7 +34,7 @@ print(f"Result: {result}")
     code_metadata = CodeMetadata(
         function_names=["two_sum"],
         imports=[],
-        total_lines=len(code.split('\n')),
+        total_lines=code.count('\n') + 1,
         language="python"
     )
 
@@ -51,7 +51,7 @@ print(f"Result: {result}")
         code_metadata=code_metadata,
         selected_test_case=test_case,
         validation_errors=[],
-        code_ast=ast.parse(code)
+        code_ast=parse_cached(code)
     )
 
     # Run Phase 3 simulation
@@ -1,7 +1,12 @@
 # ml_services/tests/test_phase4_ai_explanations.py
-import ast
+import json
+import os
+import re
+import textwrap
+import time
 import unittest
 from core.execution_simulator import ExecutionSimulator
+from utils.ast_cache import parse_cached
 from models.internal_models import (
     ProcessedInput, ProblemData, CodeMetadata, TestCase, AlgorithmPattern
 )
@@ -9,9 +14,13 @@ from models.internal_models import (
 class TestPhase4AIExplanations(unittest.TestCase):
     """Test Phase 4: AI-Enhanced Step Explanations"""
 
-    def setUp(self):
-        """Set up test fixtures for all Phase 4 tests"""
-        self.simulator = ExecutionSimulator()
+    # Educational keywords expected in hash map explanations
+    _EDU_RE = re.compile(r'hash|lookup|o\(|complement|algorithm|efficient', re.IGNORECASE)
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one simulator shared by all Phase 4 tests"""
+        cls.simulator = ExecutionSimulator()
 
     def test_hash_map_ai_explanations(self):
         """Test AI explanations for hash map algorithm pattern"""
@@ -40,7 +49,7 @@ print(f"Result: {result}")
         code_metadata = CodeMetadata(
             function_names=["two_sum"],
             imports=[],
-            total_lines=len(code.split('\n')),
+            total_lines=code.count('\n') + 1,
             language="python"
         )
 
@@ -56,7 +65,7 @@ print(f"Result: {result}")
             code_metadata=code_metadata,
             selected_test_case=test_case,
             validation_errors=[],
-            code_ast=ast.parse(code)
+            code_ast=parse_cached(code)
         )
 
         # Execute Phase 3 + Phase 4
@@ -78,9 +87,7 @@ print(f"Result: {result}")
             self.assertTrue(step.get('ai_generated', False), "Should be marked as AI-generated")
 
             # Check for educational content
-            educational_keywords = ['hash', 'lookup', 'O(', 'complement', 'algorithm', 'efficient']
-            has_educational_content = any(keyword.lower() in explanation.lower() for keyword in educational_keywords)
-            self.assertTrue(has_educational_content, f"Step explanation should contain educational content: {explanation}")
+            self.assertTrue(self._EDU_RE.search(explanation), f"Step explanation should contain educational content: {explanation}")
 
         # Display results
         print(f"✅ Phase 4 Success: Generated {len(steps)} AI-enhanced steps")
@@ -213,9 +220,7 @@ result = build_hash_map(['apple', 'banana', 'cherry'])
         """Test that AI explanations don't significantly impact performance"""
         print("\n⚡ Testing Phase 4: Performance Impact")
 
-        import time
-
-        code = '''
+        code = textwrap.dedent('''
     def performance_test(n):
         total = 0
         for i in range(n):
@@ -223,19 +228,30 @@ result = build_hash_map(['apple', 'banana', 'cherry'])
         return total
     
     result = performance_test(5)
-    '''
+    ''')
 
         processed_input = self._create_test_input(code, "Performance Test", "array", 5, 10)
 
-        # Time the execution
+        # Warm-up run: lazy imports, compile and model loading stay out of the timing
+        self.simulator.simulate_execution(processed_input, AlgorithmPattern.HASH_MAP)
+
+        # Drop the explanations cached by the warm-up so the timed run generates them again
+        # (MinimalExplainer has no cache of its own and keeps its fallback as .fallback)
+        explainer = self.simulator.step_explainer
+        for owner in (explainer, getattr(explainer, 'fallback_explainer', None), getattr(explainer, 'fallback', None)):
+            cache = getattr(owner, 'explanation_cache', None)
+            if cache is not None:
+                cache.clear()
+
+        # Time the warm execution
         start_time = time.time()
         results = self.simulator.simulate_execution(processed_input, AlgorithmPattern.HASH_MAP)
         end_time = time.time()
 
         execution_time = end_time - start_time
 
-        # Should complete within reasonable time (increased threshold)
-        self.assertLess(execution_time, 120.0, f"AI explanation should not cause excessive delays: {execution_time:.2f}s")  # 2 minutes
+        # Explanations are regenerated, so allow for one LLM round trip per step
+        self.assertLess(execution_time, 120.0, f"AI explanation should not cause excessive delays: {execution_time:.2f}s")
         self.assertGreater(len(results.get('execution_steps', [])), 0, "Should still generate steps")
 
         print(f"✅ Performance: Completed in {execution_time:.2f} seconds with AI explanations")
@@ -252,7 +268,7 @@ result = build_hash_map(['apple', 'banana', 'cherry'])
         code_metadata = CodeMetadata(
             function_names=["test_function"],
             imports=[],
-            total_lines=len(code.split('\n')),
+            total_lines=code.count('\n') + 1,
             language="python"
         )
 
@@ -268,27 +284,58 @@ result = build_hash_map(['apple', 'banana', 'cherry'])
             code_metadata=code_metadata,
             selected_test_case=test_case,
             validation_errors=[],
-            code_ast=ast.parse(code)
+            code_ast=parse_cached(code)
         )
 
 def run_phase4_tests():
-    """Run all Phase 4 tests"""
+    """Run all Phase 4 tests, one worker process per core when pytest-xdist is installed"""
     print("🧪 Running Phase 4 AI Explanation Tests...")
-    unittest.main(verbosity=2, exit=False)
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        unittest.main(verbosity=2, exit=False)
+        return
+    # Independent tests, so their Ollama round-trips can overlap across workers
+    pytest.main(["-v", "-n", "auto", __file__])
+
+# Ollama probe result shared between runs for a short time
+_OLLAMA_PROBE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "dsa_visualizer", "ollama_ok.json")
+_OLLAMA_PROBE_TTL = 30
+
+def _ollama_available():
+    """Return (ok, error), reusing a probe result recorded in the last 30 seconds"""
+    try:
+        if time.time() - os.path.getmtime(_OLLAMA_PROBE_FILE) < _OLLAMA_PROBE_TTL:
+            with open(_OLLAMA_PROBE_FILE) as f:
+                cached = json.load(f)
+            return cached["ok"], cached.get("error")
+    except (OSError, ValueError, KeyError):
+        pass
 
-if __name__ == "__main__":
-    # Check if Ollama is running
     try:
         import requests
         response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            print("✅ Ollama is running - proceeding with Phase 4 tests")
-            run_phase4_tests()
-        else:
-            print("❌ Ollama not responding - please start Ollama first")
+        ok, error = response.status_code == 200, None
     except Exception as e:
-        print(f"❌ Cannot connect to Ollama: {e}")
-        print("Please run: ollama run codellama:7b-instruct")
-
+        ok, error = False, str(e)
 
+    try:
+        os.makedirs(os.path.dirname(_OLLAMA_PROBE_FILE), exist_ok=True)
+        with open(_OLLAMA_PROBE_FILE, "w") as f:
+            json.dump({"ok": ok, "error": error, "ts": time.time()}, f)
+    except OSError:
+        pass
+    return ok, error
 
+if __name__ == "__main__":
+    # Check if Ollama is running
+    ok, error = _ollama_available()
+    if ok:
+        print("✅ Ollama is running - proceeding with Phase 4 tests")
+        run_phase4_tests()
+    elif error is None:
+        print("❌ Ollama not responding - please start Ollama first")
+    else:
+        print(f"❌ Cannot connect to Ollama: {error}")
+        print("Please run: ollama run codellama:7b-instruct")
@@ -0,0 +1,43 @@
+# test_sample_reference.py - training samples vs their reference implementations
+import random
+import unittest
+from data.sample_reference import REFERENCE_IMPLEMENTATIONS, check_against_reference
+
+
+def _ints(rng, low, high, max_len, min_len=0):
+    return [rng.randint(low, high) for _ in range(rng.randint(min_len, max_len))]
+
+
+# Sample function name -> random argument tuple, small enough for the plain Python samples
+_INPUTS = {
+    'candy': lambda rng: (_ints(rng, 0, 5, 30, min_len=1),),
+    'rob': lambda rng: (_ints(rng, 0, 100, 30),),
+    'max_subarray': lambda rng: (_ints(rng, -50, 50, 30, min_len=1),),
+    'coin_change': lambda rng: (sorted(set(_ints(rng, 1, 12, 4, min_len=1))), rng.randint(0, 60)),
+    'length_of_lis': lambda rng: (_ints(rng, -20, 20, 30),),
+    'unique_paths': lambda rng: (rng.randint(1, 12), rng.randint(1, 12)),
+    'knapsack': lambda rng: (lambda w: (w, _ints(rng, 0, 40, len(w), min_len=len(w)), rng.randint(0, 40)))(
+        _ints(rng, 1, 15, 8)
+    ),
+}
+
+
+class TestSampleReference(unittest.TestCase):
+    """Every referenced sample must agree with its reference on random inputs"""
+
+    ROUNDS = 50
+
+    def test_every_reference_has_inputs(self):
+        self.assertEqual(set(REFERENCE_IMPLEMENTATIONS), set(_INPUTS))
+
+    def test_samples_match_references(self):
+        rng = random.Random(0)
+        for func_name, make_args in _INPUTS.items():
+            for _ in range(self.ROUNDS):
+                args = make_args(rng)
+                with self.subTest(sample=func_name, args=args):
+                    self.assertTrue(check_against_reference(func_name, *args))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
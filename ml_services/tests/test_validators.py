@@ -0,0 +1,103 @@
+# ml_services/tests/test_validators.py
+import textwrap
+import unittest
+from models.internal_models import Language
+from utils.validators import CodeValidator
+
+
+class TestSecurityScan(unittest.TestCase):
+    """Pin CodeValidator.check_security behaviour: AST walk, regex fallback, prefilter and caches"""
+
+    def setUp(self):
+        self.validator = CodeValidator()
+
+    def _scan(self, code: str):
+        return list(self.validator.check_security(textwrap.dedent(code), Language.PYTHON))
+
+    def test_clean_code_has_no_warnings(self):
+        self.assertEqual(self._scan('''
+            def two_sum(nums, target):
+                seen = {}
+                for i, num in enumerate(nums):
+                    if target - num in seen:
+                        return [seen[target - num], i]
+                    seen[num] = i
+        '''), [])
+
+    def test_strings_and_comments_are_not_flagged(self):
+        self.assertEqual(self._scan('''
+            label = "import os; eval(x)"
+            # exec(code) would be unsafe here
+            doc = """getattr(obj, name)"""
+        '''), [])
+
+    def test_dangerous_import(self):
+        self.assertEqual(self._scan("import subprocess\n"), ["Potentially dangerous import: subprocess"])
+
+    def test_every_module_in_one_import_is_checked(self):
+        self.assertEqual(self._scan("import os, sys\n"), [
+            "Potentially dangerous import: os",
+            "Potentially dangerous import: sys",
+        ])
+
+    def test_from_import_and_submodule(self):
+        self.assertEqual(self._scan("from os.path import join\nimport urllib.request\n"), [
+            "Potentially dangerous import: os",
+            "Potentially dangerous import: urllib",
+        ])
+
+    def test_relative_import_is_not_flagged(self):
+        self.assertEqual(self._scan("from . import os\n"), [])
+
+    def test_dangerous_calls_by_name_and_attribute(self):
+        self.assertCountEqual(self._scan("eval(expr)\nbuiltins.exec(code)\n"), [
+            "Potentially dangerous function: eval",
+            "Potentially dangerous function: exec",
+        ])
+
+    def test_fullwidth_call_is_normalised_and_flagged(self):
+        # Non-ASCII source skips the substring prefilter; the parser NFKC-normalises ｅｖａｌ to eval
+        self.assertEqual(self._scan("ｅｖａｌ(expr)\n"), ["Potentially dangerous function: eval"])
+
+    def test_invalid_syntax_falls_back_to_regex_scan(self):
+        self.assertCountEqual(self._scan('''
+            import socket
+            def broken(:
+                return eval (data)
+        '''), [
+            "Potentially dangerous import: socket",
+            "Potentially dangerous function: eval",
+        ])
+
+    def test_regex_fallback_ignores_plain_names(self):
+        self.assertEqual(self._scan("def broken(:\n    evaluate(x)\n"), [])
+
+    def test_other_languages_are_not_scanned(self):
+        self.assertEqual(list(self.validator.check_security("import os\n", Language.UNKNOWN)), [])
+
+    def test_cached_results_are_stable_and_not_shared(self):
+        code = "import os\n"
+        first = self.validator.check_security(code, Language.PYTHON)
+        first.append("mutated by caller")
+        self.assertEqual(list(self.validator.check_security(code, Language.PYTHON)),
+                         ["Potentially dangerous import: os"])
+        self.assertEqual(len(self.validator._security_cache), 1)
+
+    def test_analyze_matches_separate_checks(self):
+        code = "import os\ndef f(x):\n    return eval(x)\n"
+        result = self.validator.analyze(code, Language.PYTHON)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(list(result.errors), [])
+        self.assertCountEqual(result.warnings, self._scan(code))
+        self.assertIsNotNone(result.tree)
+
+    def test_analyze_reports_syntax_errors(self):
+        result = self.validator.analyze("def broken(:\n    pass\n", Language.PYTHON)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].startswith("Syntax error:"))
+        self.assertIsNone(result.tree)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,21 @@
+# ml_services/utils/ast_cache.py
+import ast
+from functools import lru_cache
+
+# Longer sources are parsed on every call; the cache is keyed by the full source
+# string, so this bounds what 512 entries can hold
+MAX_CACHED_SOURCE_LEN = 16 * 1024
+
+
+def _parse(src: str) -> ast.AST:
+    return compile(src, "<unknown>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+_parse_small = lru_cache(maxsize=512)(_parse)
+
+
+def parse_cached(src: str) -> ast.AST:
+    """Parse source once per process; the returned tree is shared, so callers must not mutate it"""
+    if len(src) > MAX_CACHED_SOURCE_LEN:
+        return _parse(src)
+    return _parse_small(src)
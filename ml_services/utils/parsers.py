@@ -1,8 +1,13 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from models.internal_models import CodeMetadata, Language
+from utils.ast_cache import parse_cached
 import ast
 import re
 
+_CONSTRAINTS_RE = re.compile(r'Constraints?:?\s*(.*?)(?:\n\s*\n|\Z)', re.IGNORECASE | re.DOTALL)
+# First non-blank line, up to any of the breaks str.splitlines() recognises
+_FIRST_LINE_RE = re.compile(r'\S[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*')
+
 class ProblemParser:
     def parse(self, problem_statement: str) -> Dict[str, Any]:
         # Minimal but structured parsing
@@ -19,29 +24,40 @@ class ProblemParser:
         }
 
     def _extract_title(self, text: str) -> str:
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-        if not lines:
+        # Only scans up to the end of the first non-blank line
+        m = _FIRST_LINE_RE.search(text)
+        if not m:
             return "Unknown Problem"
-        first = lines[0]  # pick first line
+        first = m.group().strip()  # pick first line
         if len(first) < 100 and not first.endswith("."):
             return first
         return (first.split(".")[0] if "." in first else first).strip()
 
 
     def _extract_constraints_section(self, text: str) -> str:
-        m = re.search(r'Constraints?:?\s*(.*?)(?:\n\s*\n|\Z)', text, re.IGNORECASE | re.DOTALL)
+        # One regex scan finds the keyword, mid-line or not; no lowered copy of the text
+        m = _CONSTRAINTS_RE.search(text)
         return m.group(1).strip() if m else ""
 
+def _python_signature(code: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """Name and parameters of the first function in the code, or None"""
+    try:
+        tree = parse_cached(code)
+    except SyntaxError:
+        return None
+    # The function is almost always top-level; only walk the whole tree when it is not
+    func = next((n for n in tree.body if isinstance(n, ast.FunctionDef)), None) \
+        or next((n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)), None)
+    if func is None:
+        return None
+    return func.name, tuple(a.arg for a in func.args.args)
+
 class CodeParser:
     def extract_metadata(self, code: str, language: Language) -> CodeMetadata:
         if language == Language.PYTHON:
-            try:
-                tree = ast.parse(code)
-                func = next((n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)), None)
-                if func:
-                    params = [a.arg for a in func.args.args]
-                    return CodeMetadata(language=language, function_name=func.name, parameters=params)
-            except SyntaxError:
-                pass
+            signature = _python_signature(code)
+            if signature:
+                name, params = signature
+                return CodeMetadata(language=language, function_name=name, parameters=list(params))
         # Fallback
         return CodeMetadata(language=language, function_name=None, parameters=[])
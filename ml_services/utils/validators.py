@@ -1,51 +1,173 @@
 # ml_services/utils/validators.py
 import ast
+import hashlib
 import re
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
 from models.internal_models import Language
+from utils.ast_cache import parse_cached
+
+_VALIDATION_CACHE_SIZE = 1024
+
+
+def _code_key(code: str) -> bytes:
+    """Fixed-size digest of the source, used as the validation cache key."""
+    return hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _remember(cache: Dict, key: bytes, value) -> None:
+    if len(cache) >= _VALIDATION_CACHE_SIZE:
+        # Evict the oldest entry
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+@dataclass
+class ValidationResult:
+    """Syntax, security and parse results for one submission."""
+    is_valid: bool
+    errors: Sequence[str]
+    warnings: Sequence[str]
+    tree: Optional[ast.AST]  # Shared cached tree; None when the code does not parse
+
+
+class _SecurityVisitor(ast.NodeVisitor):
+    """Collects imported top-level modules and called names in one tree walk."""
+
+    def __init__(self):
+        self.imports: List[str] = []
+        self.calls = set()
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.imports.append(alias.name.split('.')[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module and not node.level:
+            self.imports.append(node.module.split('.')[0])
+
+    def visit_Call(self, node: ast.Call):
+        func = node.func
+        if isinstance(func, ast.Name):
+            self.calls.add(func.id)
+        elif isinstance(func, ast.Attribute):
+            self.calls.add(func.attr)
+        self.generic_visit(node)
+
 
 class CodeValidator:
     """Validates code syntax and basic security patterns."""
 
+    # Languages check_security scans; callers can skip the call for anything else
+    HAS_SECURITY_CHECKS = frozenset({Language.PYTHON})
+
     def __init__(self):
         # Keep lists small and conservative to avoid false positives
-        self.dangerous_imports = {
+        self.dangerous_imports = frozenset({
             'os', 'subprocess', 'sys', 'shutil', 'socket', 'urllib',
             'requests', 'http', 'ftplib', 'smtplib'
-        }
-        self.dangerous_functions = {
+        })
+        self.dangerous_functions = frozenset({
             'eval', 'exec', 'compile', '__import__', 'getattr', 'setattr',
             'delattr', 'globals', 'locals', 'vars'
-        }
+        })
+        # Code containing none of these substrings cannot produce a warning
+        self._scan_tokens = ('import', 'from', *self.dangerous_functions)
+        self._import_re = re.compile(r'(?:^|\n)\s*(?:import|from)\s+(\w+)', re.MULTILINE)
+        # One alternation so a single pass over the code finds every dangerous call
+        self._func_pattern = re.compile(
+            r'\b(' + '|'.join(map(re.escape, self.dangerous_functions)) + r')\s*\('
+        )
+        # Results per source digest; the same snippet is often validated repeatedly
+        self._syntax_cache: Dict[bytes, Tuple[bool, Tuple[str, ...]]] = {}
+        self._security_cache: Dict[bytes, Tuple[str, ...]] = {}
+
+    def validate_python_syntax(self, code: str) -> Tuple[bool, Sequence[str]]:
+        """Return (is_valid, errors); errors is a shared empty tuple when valid."""
+        is_valid, errors = self._syntax_result(_code_key(code), code)
+        return is_valid, list(errors) if errors else ()
+
+    def check_security(self, code: str, language: Language) -> Sequence[str]:
+        """Return warnings for potentially risky patterns; a shared empty tuple when there are none."""
+        if language not in self.HAS_SECURITY_CHECKS:
+            return ()
+        warnings = self._security_result(_code_key(code), code)
+        return list(warnings) if warnings else ()
+
+    def analyze(self, code: str, language: Language) -> ValidationResult:
+        """Syntax check, security scan and syntax tree from one digest, one parse and one walk."""
+        key = _code_key(code)
+        is_valid, errors = self._syntax_result(key, code)
+        warnings = self._security_result(key, code) if language in self.HAS_SECURITY_CHECKS else ()
+        tree = parse_cached(code) if is_valid else None
+        return ValidationResult(
+            is_valid=is_valid,
+            errors=list(errors) if errors else (),
+            warnings=list(warnings) if warnings else (),
+            tree=tree,
+        )
 
-    def validate_python_syntax(self, code: str) -> Tuple[bool, List[str]]:
-        """Return (is_valid, errors)."""
+    def _syntax_result(self, key: bytes, code: str) -> Tuple[bool, Tuple[str, ...]]:
+        cached = self._syntax_cache.get(key)
+        if cached is None:
+            try:
+                parse_cached(code)
+                cached = (True, ())
+            except SyntaxError as e:
+                cached = (False, (f"Syntax error: {e.msg} at line {e.lineno}",))
+            _remember(self._syntax_cache, key, cached)
+        return cached
+
+    def _security_result(self, key: bytes, code: str) -> Tuple[str, ...]:
+        cached = self._security_cache.get(key)
+        if cached is None:
+            cached = tuple(self._check_python_security(code))
+            _remember(self._security_cache, key, cached)
+        return cached
+
+    def _check_python_security(self, code: str) -> Sequence[str]:
+        # Plain substring checks clear most code without parsing. Only for ASCII
+        # source: non-ASCII identifiers are NFKC-normalised and may spell a token
+        if code.isascii() and not any(token in code for token in self._scan_tokens):
+            return ()
+
+        # Walk the (shared, cached) syntax tree so strings and comments never match
         try:
-            ast.parse(code)
-            return True, []
-        except SyntaxError as e:
-            return False, [f"Syntax error: {e.msg} at line {e.lineno}"]
-
-    def check_security(self, code: str, language: Language) -> List[str]:
-        """Return a list of warnings for potentially risky patterns."""
-        if language != Language.PYTHON:
-            return []
-        warnings: List[str] = []
-        warnings.extend(self._check_python_security(code))
+            tree = parse_cached(code)
+        except (SyntaxError, ValueError):
+            return self._check_python_security_regex(code)
+
+        visitor = _SecurityVisitor()
+        visitor.visit(tree)
+
+        # Clean code is the common case; only build a list when there is something to report
+        if self.dangerous_imports.isdisjoint(visitor.imports) and self.dangerous_functions.isdisjoint(visitor.calls):
+            return ()
+
+        warnings: List[str] = [
+            f"Potentially dangerous import: {imp}"
+            for imp in visitor.imports if imp in self.dangerous_imports
+        ]
+        for func in self.dangerous_functions:
+            if func in visitor.calls:
+                warnings.append(f"Potentially dangerous function: {func}")
+
         return warnings
 
-    def _check_python_security(self, code: str) -> List[str]:
+    def _check_python_security_regex(self, code: str) -> Sequence[str]:
+        """Best-effort text scan for code that does not parse."""
         warnings: List[str] = []
 
         # Basic import scan (best-effort, regex-based)
-        import_pattern = r'(?:^|\n)\s*(?:import|from)\s+(\w+)'
-        for imp in re.findall(import_pattern, code, re.MULTILINE):
+        for imp in self._import_re.findall(code):
             if imp in self.dangerous_imports:
                 warnings.append(f"Potentially dangerous import: {imp}")
 
         # Function call scan
+        found = {m.group(1) for m in self._func_pattern.finditer(code)}
         for func in self.dangerous_functions:
-            if re.search(rf'\b{func}\s*\(', code):
+            if func in found:
                 warnings.append(f"Potentially dangerous function: {func}")
 
         return warnings
+
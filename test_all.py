@@ -0,0 +1,18 @@
+# test_all.py - run every service test script with their requests in flight together
+import test_debug
+import test_ml_service
+import test_ml_service_fixed
+import test_simple
+from client import post_all
+
+SCRIPTS = (test_debug, test_simple, test_ml_service, test_ml_service_fixed)
+
+if __name__ == "__main__":
+    # Network waits overlap, so the run takes about as long as the slowest request
+    results = post_all([(script.url, script.data) for script in SCRIPTS])
+    for script, result in zip(SCRIPTS, results):
+        print(f"=== {script.__name__}")
+        if isinstance(result, Exception):
+            print(f"Error: {result}")
+        else:
+            script.report(result)
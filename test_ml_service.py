@@ -1,8 +1,8 @@
-import requests
 import json
+from client import ML_SERVICE_URL, post_json
 
 # Test the ML service
-url = "http://localhost:8001/api/analyze"
+url = ML_SERVICE_URL
 test_code = """def binary_search(arr, target):
     left, right = 0, len(arr) - 1
     while left <= right:
@@ -20,9 +20,12 @@ data = {
     "language": "python"
 }
 
-try:
-    response = requests.post(url, json=data)
+def report(response):
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.text}")
-except Exception as e:
-    print(f"Error: {e}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    try:
+        report(post_json(url, data))
+    except Exception as e:
+        print(f"Error: {e}")
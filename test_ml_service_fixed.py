@@ -1,8 +1,8 @@
-import requests
 import json
+from client import ML_SERVICE_URL, loads, post_json
 
 # Test the ML service with the correct format
-url = "http://localhost:8001/api/analyze"
+url = ML_SERVICE_URL
 test_code = """def binary_search(arr, target):
     left, right = 0, len(arr) - 1
     while left <= right:
@@ -25,15 +25,18 @@ data = {
     }
 }
 
-try:
-    response = requests.post(url, json=data)
+def report(response):
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
-        result = response.json()
+        result = loads(response.content)
         print("✅ Success!")
         print(f"Algorithm: {result.get('algorithm_analysis', {}).get('primary_pattern')}")
         print(f"Steps: {len(result.get('algorithm_analysis', {}).get('execution_steps', []))}")
     else:
         print(f"❌ Error: {response.text}")
-except Exception as e:
-    print(f"❌ Error: {e}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    try:
+        report(post_json(url, data))
+    except Exception as e:
+        print(f"❌ Error: {e}")
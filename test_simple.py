@@ -1,16 +1,19 @@
-import requests
 import json
+from client import ML_SERVICE_URL, post_json
 
-url = "http://localhost:8001/api/analyze"
+url = ML_SERVICE_URL
 data = {
     "code": "def binary_search(arr, target):\n    left, right = 0, len(arr) - 1\n    return left",
     "language": "python",
     "input_data": {"nums": [1, 3, 5], "target": 3}
 }
 
-try:
-    response = requests.post(url, json=data)
+def report(response):
     print(f"Status: {response.status_code}")
     print(f"Response: {response.text}")
-except Exception as e:
-    print(f"Error: {e}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    try:
+        report(post_json(url, data))
+    except Exception as e:
+        print(f"Error: {e}")